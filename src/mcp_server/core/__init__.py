@@ -6,7 +6,13 @@ used throughout the project.
 
 from __future__ import annotations
 
-from .config import ServerSettings, get_config, get_server_url, load_environment
+from .config import (
+    ServerSettings,
+    get_config,
+    get_server_url,
+    load_environment,
+    reset_environment,
+)
 from .logging import configure_logging
 
 __all__ = [
@@ -14,5 +20,6 @@ __all__ = [
     "get_config",
     "get_server_url",
     "load_environment",
+    "reset_environment",
     "configure_logging",
 ]
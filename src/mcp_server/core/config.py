@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
-from functools import lru_cache
-from pathlib import Path
+import logging
+import os
+from functools import cache, cached_property
 
 from dotenv import load_dotenv
+from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-ENV_FILE_CANDIDATES = [".env", ".env.local"]
+ENV_FILE_CANDIDATES: tuple[str, ...] = (".env", ".env.local")
+
+# Set once the candidate files have been scanned so ``.env`` is parsed at most
+# once per process; ``reset_environment`` clears it for tests.
+_ENV_LOADED = False
 
 
 class ServerSettings(BaseSettings):
@@ -22,18 +28,54 @@ class ServerSettings(BaseSettings):
 
     model_config = SettingsConfigDict(env_prefix="MCP_", case_sensitive=False)
 
+    @field_validator("path", mode="after")
+    @classmethod
+    def _normalize_path(cls, value: str) -> str:
+        """Ensure the endpoint path is absolute (``mcp`` -> ``/mcp``)."""
+
+        return value if value.startswith("/") else f"/{value}"
+
+    @cached_property
+    def log_level_no(self) -> int:
+        """Numeric ``logging`` level for ``log_level``, resolved once."""
+
+        level = logging.getLevelName(self.log_level.upper())
+        return level if isinstance(level, int) else logging.INFO
+
+    @cached_property
+    def server_url(self) -> str:
+        """Full HTTP URL of the MCP endpoint, built once per settings instance."""
+
+        path = self.path if self.path.endswith("/") else f"{self.path}/"
+        return f"http://{self.host}:{self.port}{path}"
+
 
 def load_environment() -> None:
-    """Load environment variables from the first existing ``.env`` file."""
+    """Load environment variables from the first existing ``.env`` file.
+
+    Only the first call scans the candidates; later calls are no-ops until
+    ``reset_environment`` is called. Set ``MCP_SKIP_DOTENV=1`` to skip the
+    scan entirely when the environment is already provided (e.g. containers).
+    """
 
+    global _ENV_LOADED
+    if _ENV_LOADED or os.environ.get("MCP_SKIP_DOTENV") == "1":
+        return
     for candidate in ENV_FILE_CANDIDATES:
-        path = Path(candidate)
-        if path.exists():
-            load_dotenv(path)
+        if os.path.isfile(candidate):
+            load_dotenv(candidate)
             break
+    _ENV_LOADED = True
+
+
+def reset_environment() -> None:
+    """Allow the next ``load_environment`` call to rescan the ``.env`` files."""
+
+    global _ENV_LOADED
+    _ENV_LOADED = False
 
 
-@lru_cache(maxsize=1)
+@cache
 def get_config() -> ServerSettings:
     """Return cached server configuration built from environment variables."""
 
@@ -44,11 +86,13 @@ def get_config() -> ServerSettings:
 def get_server_url() -> str:
     """Return the full HTTP URL for the MCP server based on configuration."""
 
-    cfg = get_config()
-    path = cfg.path if cfg.path.startswith("/") else f"/{cfg.path}"
-    if not path.endswith("/"):
-        path = f"{path}/"
-    return f"http://{cfg.host}:{cfg.port}{path}"
+    return get_config().server_url
 
 
-__all__ = ["ServerSettings", "get_config", "get_server_url", "load_environment"]
+__all__ = [
+    "ServerSettings",
+    "get_config",
+    "get_server_url",
+    "load_environment",
+    "reset_environment",
+]
@@ -4,12 +4,25 @@ from __future__ import annotations
 
 import logging
 
-import structlog
+# Set after the first successful configuration; later calls are no-ops so the
+# cached loggers created by ``cache_logger_on_first_use`` stay valid.
+_CONFIGURED = False
 
 
-def configure_logging(level: str = "INFO") -> None:
-    """Configure structlog and the standard logging module."""
-    logging.basicConfig(level=getattr(logging, level.upper(), logging.INFO))
+def configure_logging(level: int | str = logging.INFO) -> None:
+    """Configure structlog and the standard logging module (once per process).
+
+    ``level`` is a numeric ``logging`` level or a level name such as ``"INFO"``.
+    """
+    global _CONFIGURED
+    if _CONFIGURED:
+        return
+    # Imported lazily so importing ``mcp_server.core`` does not load structlog.
+    import structlog
+
+    if isinstance(level, str):
+        level = getattr(logging, level.upper(), logging.INFO)
+    logging.basicConfig(level=level)
     structlog.configure(
         processors=[
             structlog.contextvars.merge_contextvars,
@@ -21,3 +34,4 @@ def configure_logging(level: str = "INFO") -> None:
         wrapper_class=structlog.stdlib.BoundLogger,
         cache_logger_on_first_use=True,
     )
+    _CONFIGURED = True
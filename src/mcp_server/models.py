@@ -3,10 +3,17 @@
 from __future__ import annotations
 
 from enum import Enum
+from functools import cache
 from typing import Any
 from zoneinfo import available_timezones
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+
+@cache
+def _known_timezones() -> frozenset[str]:
+    """Return the system's IANA timezone names (the tzdata scan runs once)."""
+    return frozenset(available_timezones())
 
 
 class TimeUnit(str, Enum):
@@ -44,7 +51,7 @@ class TimezoneConvertInput(BaseModel):
     @classmethod
     def validate_timezone(cls, v: str) -> str:
         """Validate that a timezone name exists in the system database."""
-        if v not in available_timezones():
+        if v not in _known_timezones():
             raise ValueError(f"Invalid timezone: {v}")
         return v
 
@@ -77,6 +84,8 @@ class ServerConfig(BaseModel):
     debug: bool = Field(default=False, description="Enable debug mode")
     log_level: str = Field(default="INFO", description="Logging level")
 
+    model_config = ConfigDict(frozen=True)
+
 
 class ToolResult(BaseModel):
     """Standard tool result model."""
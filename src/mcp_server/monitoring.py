@@ -14,22 +14,31 @@ R = TypeVar("R")
 logger = logging.getLogger(__name__)
 
 
+def _completion_message(kind: str, func: Callable[..., object]) -> str:
+    """Build the log template for ``func`` once, with its name already filled in."""
+    name = getattr(func, "__name__", repr(func)).replace("%", "%%")
+    return f"{kind} {name} completed in %.2fms"
+
+
 def monitor_performance(func: Callable[P, R]) -> Callable[P, R]:  # noqa: UP047
-    """Decorator to monitor function performance."""
+    """Decorator to monitor function performance.
+
+    Timing is skipped entirely when INFO logging is disabled for this module.
+    """
+
+    message = _completion_message("Function", func)
 
     @wraps(func)
     def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-        start_time = time.perf_counter()
+        if not logger.isEnabledFor(logging.INFO):
+            return func(*args, **kwargs)
+        start_ns = time.perf_counter_ns()
         try:
             result = func(*args, **kwargs)
             return result
         finally:
-            duration = time.perf_counter() - start_time
-            logger.info(
-                "Function %s completed in %.2fms",
-                func.__name__,
-                duration * 1000,
-            )
+            duration_ns = time.perf_counter_ns() - start_ns
+            logger.info(message, duration_ns / 1e6)
 
     return wrapper
 
@@ -37,20 +46,23 @@ def monitor_performance(func: Callable[P, R]) -> Callable[P, R]:  # noqa: UP047
 def monitor_async_performance(  # noqa: UP047
     func: Callable[P, Awaitable[R]],
 ) -> Callable[P, Awaitable[R]]:
-    """Decorator to monitor async function performance."""
+    """Decorator to monitor async function performance.
+
+    Timing is skipped entirely when INFO logging is disabled for this module.
+    """
+
+    message = _completion_message("Async function", func)
 
     @wraps(func)
     async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-        start_time = time.perf_counter()
+        if not logger.isEnabledFor(logging.INFO):
+            return await func(*args, **kwargs)
+        start_ns = time.perf_counter_ns()
         try:
             result = await func(*args, **kwargs)
             return result
         finally:
-            duration = time.perf_counter() - start_time
-            logger.info(
-                "Async function %s completed in %.2fms",
-                func.__name__,
-                duration * 1000,
-            )
+            duration_ns = time.perf_counter_ns() - start_ns
+            logger.info(message, duration_ns / 1e6)
 
     return wrapper
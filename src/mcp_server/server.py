@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Callable
+
 import structlog
 from fastmcp import FastMCP
 from starlette.middleware.cors import CORSMiddleware
@@ -23,44 +26,67 @@ app_name = "MCP Server Template"
 mcp = FastMCP(app_name)
 
 
+# Tool functions exposed by the server, in registration order
+_TOOLS = (
+    # Core tools
+    convert_timezone,
+    to_unix_time,
+    # File tools
+    read_file,
+    list_directory,
+    # Data tools
+    parse_json,
+    format_json,
+)
+_REGISTERED = False
+
+
 def register_tools() -> None:
     """Register all tool functions with the MCP server.
 
     Tools accept Pydantic input models or primitive types for validation.
-    Idempotent: calling multiple times won't duplicate registrations due to
-    FastMCP's internal handling (safe in test setups).
+    Idempotent: only the first call registers the tools, so it is safe to
+    call from test setups and repeated entry points.
     """
-    registered_before = {t.name for t in getattr(mcp, "tools", [])}
-    # Core tools
-    mcp.tool()(convert_timezone)
-    mcp.tool()(to_unix_time)
-    # File tools
-    mcp.tool()(read_file)
-    mcp.tool()(list_directory)
-    # Data tools
-    mcp.tool()(parse_json)
-    mcp.tool()(format_json)
-    registered_after = {t.name for t in getattr(mcp, "tools", [])}
-    added = registered_after - registered_before
-    if added:
-        logger.info("Registered tools: %s", ", ".join(sorted(added)))
+    global _REGISTERED
+    if _REGISTERED:
+        return
+    for tool in _TOOLS:
+        mcp.tool()(tool)
+    _REGISTERED = True
+    logger.info("tools_registered", tools=[tool.__name__ for tool in _TOOLS])
+
+
+def _loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return uvloop's event loop factory, or None for asyncio's default loop.
+
+    uvloop is not available on Windows.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
 
 
 def main() -> None:
     """Main entry point for the server."""
     config = get_config()
-    configure_logging(config.log_level)
-    logger.info("Starting MCP server on %s:%s%s", config.host, config.port, config.path)
+    configure_logging(config.log_level_no)
+    logger.info("server_starting", host=config.host, port=config.port, path=config.path)
     register_tools()
     # Serve HTTP using configuration values (overridable via environment variables)
     # You can override host/port/path via CLI as well:
     #   fastmcp run src/mcp_server/server.py --transport http --port 9000
-    mcp.run(
-        transport="http",
-        host=config.host,
-        port=config.port,
-        path=config.path,
-        stateless_http=True,
+    asyncio.run(
+        mcp.run_async(
+            transport="http",
+            host=config.host,
+            port=config.port,
+            path=config.path,
+            stateless_http=True,
+        ),
+        loop_factory=_loop_factory(),
     )
 
 
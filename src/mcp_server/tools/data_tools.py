@@ -3,13 +3,25 @@
 from __future__ import annotations
 
 import json
+import re
 from typing import Annotated, Any, cast
 
+import orjson
+
+# orjson turns integers outside the 64-bit range into floats without raising;
+# any literal that could be one (19+ digits) is left to stdlib json instead.
+_WIDE_INT_RE = re.compile(r"\d{19}")
+
 
 def parse_json(
     text: Annotated[str, "JSON string to parse"],
 ) -> dict[str, Any]:
     """Parse JSON string to dict."""
+    if _WIDE_INT_RE.search(text) is None:
+        try:
+            return cast(dict[str, Any], orjson.loads(text))
+        except orjson.JSONDecodeError:
+            pass  # stdlib json also accepts NaN/Infinity and reports the canonical error
     return cast(dict[str, Any], json.loads(text))
 
 
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+import stat
 from pathlib import Path
 from typing import Annotated
 
@@ -12,11 +14,18 @@ def read_file(
 ) -> str:
     """Return contents of file at path."""
     p = Path(path)
-    if not p.exists():
-        raise FileNotFoundError(path)
-    if not p.is_file():
+    try:
+        mode = p.stat().st_mode
+    except (FileNotFoundError, NotADirectoryError):
+        raise FileNotFoundError(path) from None
+    if not stat.S_ISREG(mode):
         raise ValueError(f"Not a file: {path}")
-    return p.read_text(encoding=encoding)
+    # One sized read + decode instead of read_text()'s buffered text wrapper
+    text = p.read_bytes().decode(encoding)
+    if "\r" in text:
+        # Same universal-newline translation read_text() applies
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
 
 
 def list_directory(
@@ -24,8 +33,7 @@ def list_directory(
 ) -> list[str]:
     """Return file names in directory (non-recursive)."""
     p = Path(path)
-    if not p.exists():
-        raise FileNotFoundError(path)
-    if not p.is_dir():
-        raise NotADirectoryError(path)
-    return [str(child) for child in p.iterdir() if child.is_file()]
+    # scandir raises FileNotFoundError/NotADirectoryError itself, and its
+    # entries answer is_file() from the directory listing without a stat().
+    with os.scandir(p) as entries:
+        return [str(p / entry.name) for entry in entries if entry.is_file()]
@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
-from zoneinfo import ZoneInfo
+import re
 
 from mcp_server.models import TimeUnit, TimezoneConvertInput, UnixTimeInput
-from mcp_server.utils import parse_datetime
+from mcp_server.utils import get_timezone, parse_datetime
+
+# Decimal/scientific numbers as accepted by float() (including "_" separators);
+# lets to_unix_time skip float()'s raise-and-catch for date strings.
+_DIGITS = r"\d(?:_?\d)*"
+_NUMERIC_RE = re.compile(
+    rf"\s*[+-]?(?:{_DIGITS}(?:\.(?:{_DIGITS})?)?|\.{_DIGITS})(?:[eE][+-]?{_DIGITS})?\s*"
+)
 
 
 def convert_timezone(data: TimezoneConvertInput) -> str:
@@ -14,7 +21,7 @@ def convert_timezone(data: TimezoneConvertInput) -> str:
     Returns ISO 8601 by default, or a custom strftime if provided.
     """
     aware_dt = parse_datetime(data.dt, assume_tz=data.from_tz)
-    converted = aware_dt.astimezone(ZoneInfo(data.to_tz))
+    converted = aware_dt.astimezone(get_timezone(data.to_tz))
     return converted.isoformat() if data.out_format is None else converted.strftime(data.out_format)
 
 
@@ -24,11 +31,9 @@ def to_unix_time(data: UnixTimeInput) -> float:
     - Accepts flexible date/time strings or numeric Unix timestamps.
     - If numeric, value is returned (optionally scaled to ms).
     """
-    try:
+    if _NUMERIC_RE.fullmatch(data.dt):
         num = float(data.dt)
         return num if data.unit == TimeUnit.SECONDS else num * 1000.0
-    except ValueError:
-        pass
 
     aware_dt = parse_datetime(data.dt, assume_tz=data.tz)
     unix_seconds = aware_dt.timestamp()
@@ -3,11 +3,18 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
 from dateutil import parser as dateutil_parser
 
 
+@lru_cache(maxsize=64)
+def get_timezone(name: str) -> ZoneInfo:
+    """Return the ``ZoneInfo`` for an IANA name, memoized for repeated lookups."""
+    return ZoneInfo(name)
+
+
 def parse_datetime(dt: str, assume_tz: str | None = None) -> datetime:
     """Parse a wide range of datetime strings into an aware datetime.
 
@@ -15,11 +22,16 @@ def parse_datetime(dt: str, assume_tz: str | None = None) -> datetime:
     - Accepts 'Z' suffix for UTC.
     - If parsed datetime is naive and `assume_tz` provided, localize to that IANA tz.
     - If parsed datetime is naive and no assume_tz, treat it as UTC.
+    - ISO 8601 input takes the fast ``datetime.fromisoformat`` path; other
+      formats fall back to dateutil's general parser.
     """
-    parsed = dateutil_parser.parse(dt)
+    try:
+        parsed = datetime.fromisoformat(dt)
+    except ValueError:
+        parsed = dateutil_parser.parse(dt)
     if parsed.tzinfo is None:
         if assume_tz:
-            parsed = parsed.replace(tzinfo=ZoneInfo(assume_tz))
+            parsed = parsed.replace(tzinfo=get_timezone(assume_tz))
         else:
             parsed = parsed.replace(tzinfo=UTC)
     return parsed
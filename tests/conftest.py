@@ -1,8 +1,6 @@
 """Pytest fixtures and configuration."""
 
-import asyncio
 import sys
-from collections.abc import Generator
 from pathlib import Path
 from typing import Any
 
@@ -16,14 +14,6 @@ sys.path.insert(0, str(PROJECT_ROOT / "src"))
 from mcp_server.server import mcp, register_tools  # noqa: E402
 
 
-@pytest.fixture(scope="session")
-def event_loop() -> Generator[asyncio.AbstractEventLoop]:
-    """Create event loop for async tests."""
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
-
-
 @pytest.fixture(scope="session")
 def mcp_server() -> FastMCP:
     """Return MCP server with registered tools."""
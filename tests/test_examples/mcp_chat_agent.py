@@ -11,6 +11,7 @@ from __future__ import annotations
 import asyncio
 import os
 import sys
+from typing import Any
 
 from dotenv import load_dotenv
 
@@ -29,6 +30,7 @@ class MCPConversationalAgent:
         self.client = None
         self.agent = None
         self.tools = []
+        self.tools_by_name: dict[str, Any] = {}
         self.conversation_history: list[dict[str, str]] = []
 
     async def initialize(self, skip_ai: bool = False) -> bool:
@@ -64,6 +66,7 @@ class MCPConversationalAgent:
         try:
             # Discover available tools
             self.tools = await self.client.get_tools()
+            self.tools_by_name = {tool.name: tool for tool in self.tools}
             print("✅ Connected to MCP server")
             print(f"🔧 Found {len(self.tools)} tools:")
             for tool in self.tools:
@@ -218,6 +221,10 @@ class MCPConversationalAgent:
             except Exception as e:
                 print(f"❌ Error: {e}")
 
+    def _find_tool(self, name: str) -> Any | None:
+        """Return the discovered tool called ``name``, if any."""
+        return self.tools_by_name.get(name)
+
     async def _list_tools(self) -> None:
         """Show available tools and their details."""
         print(f"\n📋 Available MCP Tools: ({len(self.tools)} found)")
@@ -264,24 +271,23 @@ class MCPConversationalAgent:
             },
         ]
 
+        # Find the timezone conversion tool once, not per example
+        tool = self._find_tool("convert_timezone")
         for i, example in enumerate(examples, 1):
             print(f"\n{i}. {example['desc']}:")
+            if tool is None:
+                print("   ❌ Timezone conversion tool not found")
+                continue
             try:
-                # Find the timezone conversion tool
-                for tool in self.tools:
-                    if tool.name == "convert_timezone":
-                        result = await tool.ainvoke(
-                            {
-                                "dt": example["dt"],
-                                "from_tz": example["from_tz"],
-                                "to_tz": example["to_tz"],
-                            }
-                        )
-                        print(f"   📅 {example['dt']} ({example['from_tz']})")
-                        print(f"   ➡️  {result} ({example['to_tz']})")
-                        break
-                else:
-                    print("   ❌ Timezone conversion tool not found")
+                result = await tool.ainvoke(
+                    {
+                        "dt": example["dt"],
+                        "from_tz": example["from_tz"],
+                        "to_tz": example["to_tz"],
+                    }
+                )
+                print(f"   📅 {example['dt']} ({example['from_tz']})")
+                print(f"   ➡️  {result} ({example['to_tz']})")
             except Exception as e:
                 print(f"   ❌ Error: {e}")
 
@@ -298,17 +304,16 @@ class MCPConversationalAgent:
             },
         ]
 
+        tool = self._find_tool("to_unix_time")
         for i, example in enumerate(examples, 1):
             print(f"\n{i}. {example['desc']}:")
+            if tool is None:
+                print("   ❌ Unix time conversion tool not found")
+                continue
             try:
-                for tool in self.tools:
-                    if tool.name == "to_unix_time":
-                        result = await tool.ainvoke({"dt": example["dt"], "unit": example["unit"]})
-                        print(f"   📅 {example['dt']}")
-                        print(f"   ➡️  {result} {example['unit']}")
-                        break
-                else:
-                    print("   ❌ Unix time conversion tool not found")
+                result = await tool.ainvoke({"dt": example["dt"], "unit": example["unit"]})
+                print(f"   📅 {example['dt']}")
+                print(f"   ➡️  {result} {example['unit']}")
             except Exception as e:
                 print(f"   ❌ Error: {e}")
 
@@ -400,5 +405,11 @@ async def main() -> int:
 
 
 if __name__ == "__main__":
-    exit_code = asyncio.run(main())
+    try:
+        import uvloop
+
+        loop_factory = uvloop.new_event_loop
+    except ImportError:  # uvloop is not available on Windows
+        loop_factory = None
+    exit_code = asyncio.run(main(), loop_factory=loop_factory)
     sys.exit(exit_code)
@@ -7,6 +7,7 @@ It can be run standalone or imported for use in other testing scenarios.
 
 import asyncio
 import sys
+from collections.abc import AsyncIterator
 from typing import Any
 
 import pytest
@@ -19,9 +20,40 @@ pytestmark = pytest.mark.skip(reason="integration example requires running MCP s
 
 # Server configuration
 SERVER_URL = get_server_url()
+# Upper bound on tool calls in flight at once from the concurrent scenarios
+MAX_CONCURRENT_CALLS = 10
 
 
-async def test_basic_client_functionality() -> dict[str, Any]:
+async def call_tools_bounded(
+    client: Client, calls: list[tuple[str, dict[str, Any]]]
+) -> list[Any | Exception]:
+    """Run tool calls concurrently and return their results in call order.
+
+    At most ``MAX_CONCURRENT_CALLS`` run at once. A failing call yields its
+    exception in place of a result so the remaining calls still complete.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_CALLS)
+
+    async def bounded(name: str, arguments: dict[str, Any]) -> Any | Exception:
+        async with semaphore:
+            try:
+                return await client.call_tool(name, arguments)
+            except Exception as e:
+                return e
+
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(bounded(name, arguments)) for name, arguments in calls]
+    return [task.result() for task in tasks]
+
+
+@pytest.fixture(name="client")
+async def client_session() -> AsyncIterator[Client]:
+    """Connected client for running the phases below under pytest."""
+    async with Client(SERVER_URL) as client:
+        yield client
+
+
+async def test_basic_client_functionality(client: Client) -> dict[str, Any]:
     """Test core MCP client functionality and return results."""
     print("🧪 FastMCP Client Test Suite")
     print("=" * 40)
@@ -31,93 +63,92 @@ async def test_basic_client_functionality() -> dict[str, Any]:
     results: dict[str, Any] = {}
 
     try:
-        async with Client(SERVER_URL) as client:
-            # Test 1: Server connectivity
-            print("1. Testing server connection...")
-            await client.ping()
-            print("   ✅ Server ping successful")
-            results["ping"] = True
-
-            # Test 2: Tool discovery
-            print("2. Testing tool discovery...")
-            tools = await client.list_tools()
-            tool_names = [tool.name for tool in tools]
-            print(f"   ✅ Found {len(tools)} tools: {tool_names}")
-            results["tools"] = tool_names
-
-            # Verify expected tools are present
-            expected_tools = ["convert_timezone", "to_unix_time"]
-            missing_tools = [t for t in expected_tools if t not in tool_names]
-            if missing_tools:
-                print(f"   ⚠️  Missing expected tools: {missing_tools}")
-
-            # Test 3: Timezone conversion
-            print("3. Testing timezone conversion...")
-            tz_result = await client.call_tool(
-                "convert_timezone",
-                {
-                    "dt": "2025-08-10T15:30:00",
-                    "from_tz": "Europe/Madrid",
-                    "to_tz": "America/New_York",
-                },
-            )
-
-            # Handle different result formats
-            converted = str(tz_result.data if hasattr(tz_result, "data") else tz_result)
-            print(f"   ✅ Madrid 15:30 -> NYC: {converted}")
-            results["timezone_conversion"] = converted
-
-            # Verify conversion looks correct
-            expected_indicators = ["America/New_York", "-04", "T11:30", "11:30"]
-            if any(indicator in converted for indicator in expected_indicators):
-                print("   ✅ Timezone conversion appears correct")
-            else:
-                print(f"   ⚠️  Unexpected conversion result: {converted}")
-
-            # Test 4: Unix time conversion
-            print("4. Testing Unix time conversion...")
-            unix_result = await client.call_tool(
-                "to_unix_time",
-                {
-                    "dt": "2025-08-10T15:30:00+02:00",
-                    "unit": "milliseconds",
-                },
-            )
-
-            unix_data = unix_result.data if hasattr(unix_result, "data") else unix_result
-            unix_time = float(unix_data)
-            print(f"   ✅ Unix time (ms): {unix_time}")
-            results["unix_time"] = unix_time
-
-            # Verify it's a reasonable timestamp (should be in 2025)
-            if unix_time > 1735689600000:  # 2025-01-01 in ms
-                print("   ✅ Unix timestamp appears reasonable for 2025")
-            else:
-                print(f"   ⚠️  Unix timestamp seems incorrect: {unix_time}")
-
-            # Test 5: Resource listing (if any)
-            print("5. Testing resource discovery...")
-            try:
-                resources = await client.list_resources()
-                print(f"   ✅ Found {len(resources)} resources")
-                results["resources"] = [r.uri for r in resources] if resources else []
-            except Exception as e:
-                print(f"   ℹ️  No resources available or error: {e}")
-                results["resources"] = []
-
-            # Test 6: Prompt listing (if any)
-            print("6. Testing prompt discovery...")
-            try:
-                prompts = await client.list_prompts()
-                print(f"   ✅ Found {len(prompts)} prompts")
-                results["prompts"] = [p.name for p in prompts] if prompts else []
-            except Exception as e:
-                print(f"   ℹ️  No prompts available or error: {e}")
-                results["prompts"] = []
-
-            print("\n🎉 All FastMCP client tests passed!")
-            results["success"] = True
-            return results
+        # Test 1: Server connectivity
+        print("1. Testing server connection...")
+        await client.ping()
+        print("   ✅ Server ping successful")
+        results["ping"] = True
+
+        # Test 2: Tool discovery
+        print("2. Testing tool discovery...")
+        tools = await client.list_tools()
+        tool_names = [tool.name for tool in tools]
+        print(f"   ✅ Found {len(tools)} tools: {tool_names}")
+        results["tools"] = tool_names
+
+        # Verify expected tools are present
+        expected_tools = ["convert_timezone", "to_unix_time"]
+        missing_tools = [t for t in expected_tools if t not in tool_names]
+        if missing_tools:
+            print(f"   ⚠️  Missing expected tools: {missing_tools}")
+
+        # Test 3: Timezone conversion
+        print("3. Testing timezone conversion...")
+        tz_result = await client.call_tool(
+            "convert_timezone",
+            {
+                "dt": "2025-08-10T15:30:00",
+                "from_tz": "Europe/Madrid",
+                "to_tz": "America/New_York",
+            },
+        )
+
+        # Handle different result formats
+        converted = str(tz_result.data if hasattr(tz_result, "data") else tz_result)
+        print(f"   ✅ Madrid 15:30 -> NYC: {converted}")
+        results["timezone_conversion"] = converted
+
+        # Verify conversion looks correct
+        expected_indicators = ["America/New_York", "-04", "T11:30", "11:30"]
+        if any(indicator in converted for indicator in expected_indicators):
+            print("   ✅ Timezone conversion appears correct")
+        else:
+            print(f"   ⚠️  Unexpected conversion result: {converted}")
+
+        # Test 4: Unix time conversion
+        print("4. Testing Unix time conversion...")
+        unix_result = await client.call_tool(
+            "to_unix_time",
+            {
+                "dt": "2025-08-10T15:30:00+02:00",
+                "unit": "milliseconds",
+            },
+        )
+
+        unix_data = unix_result.data if hasattr(unix_result, "data") else unix_result
+        unix_time = float(unix_data)
+        print(f"   ✅ Unix time (ms): {unix_time}")
+        results["unix_time"] = unix_time
+
+        # Verify it's a reasonable timestamp (should be in 2025)
+        if unix_time > 1735689600000:  # 2025-01-01 in ms
+            print("   ✅ Unix timestamp appears reasonable for 2025")
+        else:
+            print(f"   ⚠️  Unix timestamp seems incorrect: {unix_time}")
+
+        # Test 5: Resource listing (if any)
+        print("5. Testing resource discovery...")
+        try:
+            resources = await client.list_resources()
+            print(f"   ✅ Found {len(resources)} resources")
+            results["resources"] = [r.uri for r in resources] if resources else []
+        except Exception as e:
+            print(f"   ℹ️  No resources available or error: {e}")
+            results["resources"] = []
+
+        # Test 6: Prompt listing (if any)
+        print("6. Testing prompt discovery...")
+        try:
+            prompts = await client.list_prompts()
+            print(f"   ✅ Found {len(prompts)} prompts")
+            results["prompts"] = [p.name for p in prompts] if prompts else []
+        except Exception as e:
+            print(f"   ℹ️  No prompts available or error: {e}")
+            results["prompts"] = []
+
+        print("\n🎉 All FastMCP client tests passed!")
+        results["success"] = True
+        return results
 
     except Exception as e:
         print(f"\n❌ Test failed: {e}")
@@ -126,56 +157,66 @@ async def test_basic_client_functionality() -> dict[str, Any]:
         return results
 
 
-async def test_advanced_scenarios() -> None:
+async def test_advanced_scenarios(client: Client) -> None:
     """Test some advanced usage scenarios."""
     print("\n🔬 Advanced Test Scenarios")
     print("=" * 40)
 
-    async with Client(SERVER_URL) as client:
-        # Test timezone conversion with different formats
-        test_cases = [
-            {
-                "name": "ISO format with timezone",
-                "dt": "2025-12-25T00:00:00+01:00",
-                "from_tz": "Europe/Paris",
-                "to_tz": "UTC",
-            },
-            {
-                "name": "Simple date string",
-                "dt": "2025-06-15 14:30",
-                "from_tz": "Asia/Tokyo",
-                "to_tz": "America/Los_Angeles",
-            },
-            {
-                "name": "Edge case - DST transition",
-                "dt": "2025-03-30 02:30",  # DST transition in Europe
-                "from_tz": "Europe/Berlin",
-                "to_tz": "UTC",
-            },
-        ]
-
-        for i, case in enumerate(test_cases, 1):
-            print(f"{i}. {case['name']}...")
-            try:
-                # Remove the 'name' field from the parameters
-                params = {k: v for k, v in case.items() if k != "name"}
-                result = await client.call_tool("convert_timezone", params)
-                converted = str(result.data if hasattr(result, "data") else result)
-                print(f"   ✅ {case['dt']} ({case['from_tz']}) -> {converted}")
-            except Exception as e:
-                print(f"   ❌ Failed: {e}")
-
-        # Test Unix time with different units
-        print(f"{len(test_cases) + 1}. Unix time conversion (seconds vs milliseconds)...")
-        base_dt = "2025-01-01T00:00:00Z"
-
-        for unit in ["seconds", "milliseconds"]:
-            try:
-                result = await client.call_tool("to_unix_time", {"dt": base_dt, "unit": unit})
-                timestamp = result.data if hasattr(result, "data") else result
-                print(f"   ✅ {base_dt} -> {timestamp} {unit}")
-            except Exception as e:
-                print(f"   ❌ Failed for {unit}: {e}")
+    # Test timezone conversion with different formats
+    test_cases = [
+        {
+            "name": "ISO format with timezone",
+            "dt": "2025-12-25T00:00:00+01:00",
+            "from_tz": "Europe/Paris",
+            "to_tz": "UTC",
+        },
+        {
+            "name": "Simple date string",
+            "dt": "2025-06-15 14:30",
+            "from_tz": "Asia/Tokyo",
+            "to_tz": "America/Los_Angeles",
+        },
+        {
+            "name": "Edge case - DST transition",
+            "dt": "2025-03-30 02:30",  # DST transition in Europe
+            "from_tz": "Europe/Berlin",
+            "to_tz": "UTC",
+        },
+    ]
+
+    # Issue the conversions concurrently over the shared session, then
+    # report them in case order. The 'name' field is not a tool parameter.
+    tz_results = await call_tools_bounded(
+        client,
+        [
+            ("convert_timezone", {k: v for k, v in case.items() if k != "name"})
+            for case in test_cases
+        ],
+    )
+
+    for i, (case, result) in enumerate(zip(test_cases, tz_results, strict=True), 1):
+        print(f"{i}. {case['name']}...")
+        if isinstance(result, Exception):
+            print(f"   ❌ Failed: {result}")
+            continue
+        converted = str(result.data if hasattr(result, "data") else result)
+        print(f"   ✅ {case['dt']} ({case['from_tz']}) -> {converted}")
+
+    # Test Unix time with different units
+    print(f"{len(test_cases) + 1}. Unix time conversion (seconds vs milliseconds)...")
+    base_dt = "2025-01-01T00:00:00Z"
+
+    units = ["seconds", "milliseconds"]
+    unit_results = await call_tools_bounded(
+        client, [("to_unix_time", {"dt": base_dt, "unit": unit}) for unit in units]
+    )
+
+    for unit, result in zip(units, unit_results, strict=True):
+        if isinstance(result, Exception):
+            print(f"   ❌ Failed for {unit}: {result}")
+            continue
+        timestamp = result.data if hasattr(result, "data") else result
+        print(f"   ✅ {base_dt} -> {timestamp} {unit}")
 
 
 def print_usage() -> None:
@@ -211,13 +252,15 @@ async def main() -> int:
         run_basic = False
 
     try:
-        if run_basic:
-            results = await test_basic_client_functionality()
-            if not results.get("success", False):
-                return 1
+        # One session (and connection pool) shared by every phase
+        async with Client(SERVER_URL) as client:
+            if run_basic:
+                results = await test_basic_client_functionality(client)
+                if not results.get("success", False):
+                    return 1
 
-        if run_advanced:
-            await test_advanced_scenarios()
+            if run_advanced:
+                await test_advanced_scenarios(client)
 
         print("\n📊 Test Summary:")
         print("   ✅ All tests completed successfully!")
@@ -235,5 +278,11 @@ async def main() -> int:
 
 
 if __name__ == "__main__":
-    exit_code = asyncio.run(main())
+    try:
+        import uvloop
+
+        loop_factory = uvloop.new_event_loop
+    except ImportError:  # uvloop is not available on Windows
+        loop_factory = None
+    exit_code = asyncio.run(main(), loop_factory=loop_factory)
     sys.exit(exit_code)
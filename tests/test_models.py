@@ -0,0 +1,22 @@
+"""Tests for the shared pydantic models."""
+
+import pytest
+from pydantic import ValidationError
+
+from mcp_server.models import ServerConfig, ToolResult
+
+
+class TestServerConfig:
+    def test_is_frozen_and_hashable(self) -> None:
+        config = ServerConfig()
+        with pytest.raises(ValidationError):
+            config.port = 9000  # type: ignore[misc]
+        assert hash(config) == hash(ServerConfig())
+
+
+class TestToolResult:
+    def test_metadata_is_mutable(self) -> None:
+        result = ToolResult()
+        result.metadata["source"] = "test"
+        result.metadata = {"replaced": True}
+        assert result.metadata == {"replaced": True}
@@ -24,7 +24,7 @@ def test_monitor_performance() -> None:
         assert result == "completed"
         mock_logger.info.assert_called_once()
         args = mock_logger.info.call_args[0]
-        assert "slow_function" in args[1]
+        assert "slow_function" in args[0]
         assert "completed in" in args[0]
 
 
@@ -44,7 +44,7 @@ async def test_monitor_async_performance() -> None:
         assert result == "async completed"
         mock_logger.info.assert_called_once()
         args = mock_logger.info.call_args[0]
-        assert "async_slow_function" in args[1]
+        assert "async_slow_function" in args[0]
         assert "Async function" in args[0]
 
 
@@ -63,7 +63,7 @@ def test_monitor_performance_with_exception() -> None:
         # Should still log performance even when exception is raised
         mock_logger.info.assert_called_once()
         args = mock_logger.info.call_args[0]
-        assert "failing_function" in args[1]
+        assert "failing_function" in args[0]
 
 
 @pytest.mark.asyncio
@@ -82,4 +82,17 @@ async def test_monitor_async_performance_with_exception() -> None:
         # Should still log performance even when exception is raised
         mock_logger.info.assert_called_once()
         args = mock_logger.info.call_args[0]
-        assert "async_failing_function" in args[1]
+        assert "async_failing_function" in args[0]
+
+
+def test_monitor_performance_skips_when_info_disabled() -> None:
+    """No timing or log call happens when INFO is disabled for the logger."""
+
+    @monitor_performance
+    def quiet_function() -> str:
+        return "done"
+
+    with patch("mcp_server.monitoring.logger") as mock_logger:
+        mock_logger.isEnabledFor.return_value = False
+        assert quiet_function() == "done"
+        mock_logger.info.assert_not_called()
@@ -1,10 +1,22 @@
 """Server structure tests using singleton registration pattern."""
 
+import asyncio
+import logging
+import os
+import sys
+from pathlib import Path
+
 import anyio
 import pytest
 
-from mcp_server.core import get_config
-from mcp_server.server import main, mcp, register_tools
+from mcp_server.core import (
+    ServerSettings,
+    get_config,
+    get_server_url,
+    load_environment,
+    reset_environment,
+)
+from mcp_server.server import _loop_factory, main, mcp, register_tools
 
 
 class TestServerStructure:
@@ -30,7 +42,7 @@ def test_environment_configuration(monkeypatch: pytest.MonkeyPatch) -> None:
 
     captured: dict[str, object] = {}
 
-    def fake_run(
+    async def fake_run_async(
         *,
         transport: str,
         host: str,
@@ -41,7 +53,84 @@ def test_environment_configuration(monkeypatch: pytest.MonkeyPatch) -> None:
         del transport, stateless_http
         captured.update(host=host, port=port, path=path)
 
-    monkeypatch.setattr("mcp_server.server.mcp.run", fake_run)
+    monkeypatch.setattr("mcp_server.server.mcp.run_async", fake_run_async)
     main()
 
     assert captured == {"host": "0.0.0.0", "port": 9001, "path": "/custom"}
+
+
+def test_loop_factory_without_uvloop(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Without uvloop the server falls back to asyncio's default loop."""
+
+    monkeypatch.setitem(sys.modules, "uvloop", None)
+    assert _loop_factory() is None
+
+
+def test_loop_factory_with_uvloop() -> None:
+    """With uvloop installed, the server loop comes from its factory, not a policy."""
+
+    uvloop = pytest.importorskip("uvloop")
+    factory = _loop_factory()
+    assert factory is uvloop.new_event_loop
+    with asyncio.Runner(loop_factory=factory) as runner:
+        assert isinstance(runner.get_loop(), uvloop.Loop)
+
+
+def test_server_url_normalizes_path(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The server URL always carries leading and trailing slashes on the path."""
+
+    monkeypatch.setenv("MCP_HOST", "localhost")
+    monkeypatch.setenv("MCP_PORT", "9002")
+    monkeypatch.setenv("MCP_PATH", "custom")
+    get_config.cache_clear()
+
+    assert get_config().path == "/custom"
+    assert get_server_url() == "http://localhost:9002/custom/"
+    assert get_server_url() is get_server_url()
+
+
+def test_load_environment_reads_dotenv_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The ``.env`` file is parsed once until ``reset_environment`` is called."""
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("MCP_TEST_DOTENV", raising=False)
+    (tmp_path / ".env").write_text("MCP_TEST_DOTENV=first\n")
+    reset_environment()
+
+    load_environment()
+    assert os.environ["MCP_TEST_DOTENV"] == "first"
+
+    del os.environ["MCP_TEST_DOTENV"]
+    load_environment()
+    assert "MCP_TEST_DOTENV" not in os.environ
+
+    reset_environment()
+    load_environment()
+    assert os.environ.pop("MCP_TEST_DOTENV") == "first"
+
+
+def test_load_environment_skips_dotenv_when_requested(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """``MCP_SKIP_DOTENV=1`` bypasses the ``.env`` scan entirely."""
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("MCP_SKIP_DOTENV", "1")
+    monkeypatch.delenv("MCP_TEST_DOTENV", raising=False)
+    (tmp_path / ".env").write_text("MCP_TEST_DOTENV=first\n")
+    reset_environment()
+
+    load_environment()
+    assert "MCP_TEST_DOTENV" not in os.environ
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [("debug", logging.DEBUG), ("WARNING", logging.WARNING), ("verbose", logging.INFO)],
+)
+def test_log_level_no(name: str, expected: int) -> None:
+    """Level names resolve to numeric levels, defaulting to INFO."""
+
+    assert ServerSettings(log_level=name).log_level_no == expected
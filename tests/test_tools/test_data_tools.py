@@ -1,5 +1,7 @@
 """Tests for data tools."""
 
+import pytest
+
 from mcp_server.tools.data_tools import format_json, parse_json
 
 
@@ -8,6 +10,19 @@ class TestParseJson:
         data = parse_json('{"a": 1, "b": 2}')
         assert data == {"a": 1, "b": 2}
 
+    def test_accepts_non_finite_numbers(self) -> None:
+        data = parse_json('{"x": NaN}')
+        assert data["x"] != data["x"]
+
+    def test_keeps_wide_integers_exact(self) -> None:
+        data = parse_json('{"n": 123456789012345678901234567890}')
+        assert data["n"] == 123456789012345678901234567890
+        assert isinstance(data["n"], int)
+
+    def test_invalid_json(self) -> None:
+        with pytest.raises(ValueError):
+            parse_json("{not json}")
+
 
 class TestFormatJson:
     def test_formats_mapping(self) -> None:
@@ -17,3 +32,27 @@ class TestFormatJson:
     def test_round_trip(self) -> None:
         original = {"x": "y"}
         assert parse_json(format_json(original)) == original
+
+    def test_non_default_indent(self) -> None:
+        assert format_json({"b": 2, "a": 1}, indent=None) == '{"a": 1, "b": 2}'
+
+    def test_keeps_unicode(self) -> None:
+        assert format_json({"city": "Málaga"}) == '{\n  "city": "Málaga"\n}'
+
+    def test_large_integers(self) -> None:
+        assert format_json({"n": 2**70}) == f'{{\n  "n": {2**70}\n}}'
+
+    def test_round_trip_wide_integer(self) -> None:
+        data = parse_json(format_json({"n": 2**70}))
+        assert data["n"] == 2**70
+        assert isinstance(data["n"], int)
+
+    def test_round_trip_non_finite_numbers(self) -> None:
+        text = format_json({"inf": float("inf"), "nan": float("nan")})
+        assert text == '{\n  "inf": Infinity,\n  "nan": NaN\n}'
+        data = parse_json(text)
+        assert data["inf"] == float("inf")
+        assert data["nan"] != data["nan"]
+
+    def test_float_formatting(self) -> None:
+        assert format_json({"a": 1e16, "b": 1e-7}, indent=None) == '{"a": 1e+16, "b": 1e-07}'
@@ -17,6 +17,15 @@ class TestReadFile:
         with pytest.raises(FileNotFoundError):
             read_file(str(tmp_path / "missing.txt"))
 
+    def test_directory_is_not_a_file(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="Not a file"):
+            read_file(str(tmp_path))
+
+    def test_normalizes_newlines(self, tmp_path: Path) -> None:
+        p = tmp_path / "crlf.txt"
+        p.write_bytes(b"one\r\ntwo\rthree\n")
+        assert read_file(str(p)) == "one\ntwo\nthree\n"
+
 
 class TestListDirectory:
     def test_lists_only_files(self, tmp_path: Path) -> None:
@@ -34,3 +43,7 @@ class TestListDirectory:
         file1.write_text("a")
         with pytest.raises(NotADirectoryError):
             list_directory(str(file1))
+
+    def test_missing_directory(self, tmp_path: Path) -> None:
+        with pytest.raises(FileNotFoundError):
+            list_directory(str(tmp_path / "missing"))
@@ -49,6 +49,10 @@ class TestUnixTime:
         sec = to_unix_time(UnixTimeInput(dt="1754899800", unit="seconds"))
         assert abs(sec - 1754899800) < 1e-6
 
+    def test_numeric_passthrough_fractional_milliseconds(self) -> None:
+        ms = to_unix_time(UnixTimeInput(dt="1754899800.5", unit="milliseconds"))
+        assert ms == 1754899800500.0
+
 
 class TestDatetimeParser:
     def test_parse_naive_assumes_utc(self) -> None:
@@ -61,3 +65,11 @@ class TestDatetimeParser:
         dt_val = parse_datetime("2025-01-01 00:00:00", assume_tz="Europe/Madrid")
         assert dt_val.tzinfo is not None
         assert "Madrid" in str(dt_val.tzinfo)
+
+    def test_parse_iso_zulu(self) -> None:
+        dt_val = parse_datetime("2025-08-10T09:30:00Z", assume_tz="Europe/Madrid")
+        assert dt_val.isoformat() == "2025-08-10T09:30:00+00:00"
+
+    def test_parse_non_iso_format(self) -> None:
+        dt_val = parse_datetime("2025/08/10 09:30:00")
+        assert dt_val.isoformat() == "2025-08-10T09:30:00+00:00"